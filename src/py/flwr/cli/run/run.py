@@ -16,7 +16,6 @@
 
 import subprocess
 import sys
-from logging import DEBUG
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -27,7 +26,6 @@ from flwr.cli.build import build
 from flwr.cli.config_utils import load_and_validate
 from flwr.common.config import flatten_dict, parse_config_args
 from flwr.common.grpc import GRPC_MAX_MESSAGE_LENGTH, create_channel
-from flwr.common.logger import log
 from flwr.common.serde import user_config_to_proto
 from flwr.proto.exec_pb2 import StartRunRequest  # pylint: disable=E0611
 from flwr.proto.exec_pb2_grpc import ExecStub
@@ -120,10 +118,6 @@ def _run_with_superexec(
     config_overrides: Optional[List[str]],
 ) -> None:
 
-    def on_channel_state_change(channel_connectivity: str) -> None:
-        """Log channel connectivity."""
-        log(DEBUG, channel_connectivity)
-
     insecure_str = federation_config.get("insecure")
     if root_certificates := federation_config.get("root-certificates"):
         root_certificates_bytes = Path(root_certificates).read_bytes()
@@ -159,7 +153,6 @@ def _run_with_superexec(
         max_message_length=GRPC_MAX_MESSAGE_LENGTH,
         interceptors=None,
     )
-    channel.subscribe(on_channel_state_change)
     stub = ExecStub(channel)
 
     fab_path = Path(build(app))
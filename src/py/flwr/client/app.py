@@ -29,7 +29,7 @@ from flwr.client.client import Client
 from flwr.client.client_app import ClientApp, LoadClientAppError
 from flwr.client.typing import ClientFnExt
 from flwr.common import GRPC_MAX_MESSAGE_LENGTH, Context, EventType, Message, event
-from flwr.common.address import parse_address
+from flwr.common.address import is_unix_socket_address, parse_address
 from flwr.common.constant import (
     MISSING_EXTRA_REST,
     TRANSPORT_TYPE_GRPC_ADAPTER,
@@ -613,12 +613,16 @@ def _init_connection(transport: Optional[str], server_address: str) -> Tuple[
     str,
     Type[Exception],
 ]:
-    # Parse IP address
-    parsed_address = parse_address(server_address)
-    if not parsed_address:
-        sys.exit(f"Server address ({server_address}) cannot be parsed.")
-    host, port, is_v6 = parsed_address
-    address = f"[{host}]:{port}" if is_v6 else f"{host}:{port}"
+    # gRPC connects to Unix domain sockets directly
+    if transport != TRANSPORT_TYPE_REST and is_unix_socket_address(server_address):
+        address = server_address
+    else:
+        # Parse IP address
+        parsed_address = parse_address(server_address)
+        if not parsed_address:
+            sys.exit(f"Server address ({server_address}) cannot be parsed.")
+        host, port, is_v6 = parsed_address
+        address = f"[{host}]:{port}" if is_v6 else f"{host}:{port}"
 
     # Set the default transport layer
     if transport is None:
@@ -55,7 +55,7 @@ from flwr.proto.transport_pb2_grpc import FlowerServiceStub  # pylint: disable=E
 
 def on_channel_state_change(channel_connectivity: str) -> None:
     """Log channel connectivity."""
-    log(DEBUG, channel_connectivity)
+    log(DEBUG, "%s", channel_connectivity)
 
 
 @contextmanager
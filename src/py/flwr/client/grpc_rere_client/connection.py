@@ -65,7 +65,7 @@ from .grpc_adapter import GrpcAdapter
 
 def on_channel_state_change(channel_connectivity: str) -> None:
     """Log channel connectivity."""
-    log(DEBUG, channel_connectivity)
+    log(DEBUG, "%s", channel_connectivity)
 
 
 @contextmanager
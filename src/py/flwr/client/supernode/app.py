@@ -18,7 +18,7 @@ import argparse
 import sys
 from logging import DEBUG, INFO, WARN
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from cryptography.exceptions import UnsupportedAlgorithm
 from cryptography.hazmat.primitives.asymmetric import ec
@@ -226,6 +226,10 @@ def _get_load_client_app_fn(
         if not valid and error_msg:
             raise LoadClientAppError(error_msg) from None
 
+    # Installed FABs are identified by `fab_id` and `fab_version`, so their project
+    # directory and ClientApp reference only need to be resolved once
+    installed_app_refs: Dict[Tuple[str, str], Tuple[Path, str]] = {}
+
     def _load(fab_id: str, fab_version: str) -> ClientApp:
         runtime_app_dir = Path(app_path if app_path else "").absolute()
         # If multi-app feature is disabled
@@ -248,6 +252,9 @@ def _get_load_client_app_fn(
 
             # Set app reference
             client_app_ref = config["tool"]["flwr"]["app"]["components"]["clientapp"]
+        # If multi-app feature is enabled and the FAB was resolved before
+        elif (fab_id, fab_version) in installed_app_refs:
+            runtime_app_dir, client_app_ref = installed_app_refs[(fab_id, fab_version)]
         # If multi-app feature is enabled
         else:
             try:
@@ -260,6 +267,10 @@ def _get_load_client_app_fn(
 
             # Set app reference
             client_app_ref = config["tool"]["flwr"]["app"]["components"]["clientapp"]
+            installed_app_refs[(fab_id, fab_version)] = (
+                runtime_app_dir,
+                client_app_ref,
+            )
 
         # Load ClientApp
         log(
@@ -379,7 +390,8 @@ def _parse_args_common(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--superlink",
         default=ADDRESS_FLEET_API_GRPC_RERE,
-        help="SuperLink Fleet API (gRPC-rere) address (IPv4, IPv6, or a domain name)",
+        help="SuperLink Fleet API (gRPC-rere) address (IPv4, IPv6, a domain name, "
+        "or a Unix domain socket such as `unix:/tmp/flwr-fleet.sock`)",
     )
     parser.add_argument(
         "--max-retries",
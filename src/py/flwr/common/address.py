@@ -18,6 +18,7 @@ from ipaddress import ip_address
 from typing import Optional, Tuple
 
 IPV6: int = 6
+UNIX_SOCKET_PREFIX = "unix:"
 
 
 def parse_address(address: str) -> Optional[Tuple[str, int, Optional[bool]]]:
@@ -57,3 +58,23 @@ def parse_address(address: str) -> Optional[Tuple[str, int, Optional[bool]]]:
 
     except ValueError:
         return None
+
+
+def is_unix_socket_address(address: str) -> bool:
+    """Check if the address refers to a Unix domain socket.
+
+    gRPC accepts Unix domain socket addresses of the form `unix:path` and
+    `unix:///absolute/path`. When the client and the server run on the same machine,
+    they avoid the overhead of the TCP loopback interface.
+
+    Parameters
+    ----------
+    address : str
+        The address to check, for example, 'unix:/tmp/flwr-fleet.sock'.
+
+    Returns
+    -------
+    bool
+        True if the address starts with `unix:` and contains a path, False otherwise.
+    """
+    return address.startswith(UNIX_SOCKET_PREFIX) and address != UNIX_SOCKET_PREFIX
@@ -15,7 +15,7 @@
 """Flower IP address utils."""
 
 
-from .address import parse_address
+from .address import is_unix_socket_address, parse_address
 
 
 def test_ipv4_correct() -> None:
@@ -140,3 +140,24 @@ def test_domain_incorrect() -> None:
 
         # Assert
         assert actual is None
+
+
+def test_unix_socket_address() -> None:
+    """Test if Unix domain socket addresses are recognized."""
+    # Prepare
+    addresses = [
+        ("unix:/tmp/flwr-fleet.sock", True),
+        ("unix:///tmp/flwr-fleet.sock", True),
+        ("unix:relative.sock", True),
+        ("unix:", False),
+        ("127.0.0.1:8080", False),
+        ("[::1]:8080", False),
+        ("flower.ai:8080", False),
+    ]
+
+    for address, expected in addresses:
+        # Execute
+        actual = is_unix_socket_address(address)
+
+        # Assert
+        assert actual == expected
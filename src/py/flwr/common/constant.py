@@ -92,6 +92,8 @@ class SType:
     """Serialisation type."""
 
     NUMPY = "numpy.ndarray"
+    NUMPY_BF16 = "numpy.ndarray.bf16"
+    NUMPY_INT8 = "numpy.ndarray.int8"
 
     def __new__(cls) -> SType:
         """Prevent instantiation."""
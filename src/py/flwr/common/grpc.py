@@ -15,8 +15,9 @@
 """Utility functions for gRPC."""
 
 
+import json
 from logging import DEBUG
-from typing import Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import grpc
 
@@ -25,14 +26,27 @@ from flwr.common.logger import log
 GRPC_MAX_MESSAGE_LENGTH: int = 536_870_912  # == 512 * 1024 * 1024
 
 
-def create_channel(
+def create_channel(  # pylint: disable=too-many-arguments
     server_address: str,
     insecure: bool,
     root_certificates: Optional[bytes] = None,
     max_message_length: int = GRPC_MAX_MESSAGE_LENGTH,
     interceptors: Optional[Sequence[grpc.UnaryUnaryClientInterceptor]] = None,
+    compression: Optional[grpc.Compression] = None,
+    service_config: Optional[Dict[str, Any]] = None,
 ) -> grpc.Channel:
-    """Create a gRPC channel, either secure or insecure."""
+    """Create a gRPC channel, either secure or insecure.
+
+    If `compression` is set (e.g., `grpc.Compression.Gzip`), it is used as the
+    default compression algorithm for all calls made on the channel. Compression
+    trades some CPU time for fewer bytes on the wire, which pays off for large
+    messages such as those carrying model parameters.
+
+    If `service_config` is set, it is passed to gRPC as the channel's service config.
+    This can be used to configure a retry policy that gRPC applies natively to all
+    calls made on the channel, see
+    https://github.com/grpc/proposal/blob/master/A6-client-retries.md
+    """
     # Check for conflicting parameters
     if insecure and root_certificates is not None:
         raise ValueError(
@@ -43,18 +57,26 @@ def create_channel(
 
     # Possible options:
     # https://github.com/grpc/grpc/blob/v1.43.x/include/grpc/impl/codegen/grpc_types.h
-    channel_options = [
+    channel_options: List[Tuple[str, Any]] = [
         ("grpc.max_send_message_length", max_message_length),
         ("grpc.max_receive_message_length", max_message_length),
     ]
+    if service_config is not None:
+        channel_options.append(("grpc.enable_retries", 1))
+        channel_options.append(("grpc.service_config", json.dumps(service_config)))
 
     if insecure:
-        channel = grpc.insecure_channel(server_address, options=channel_options)
+        channel = grpc.insecure_channel(
+            server_address, options=channel_options, compression=compression
+        )
         log(DEBUG, "Opened insecure gRPC connection (no certificates were passed)")
     else:
         ssl_channel_credentials = grpc.ssl_channel_credentials(root_certificates)
         channel = grpc.secure_channel(
-            server_address, ssl_channel_credentials, options=channel_options
+            server_address,
+            ssl_channel_credentials,
+            options=channel_options,
+            compression=compression,
         )
         log(DEBUG, "Opened secure gRPC connection using certificates")
 
@@ -0,0 +1,94 @@
+# Copyright 2024 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for gRPC utility functions."""
+
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+import grpc
+
+from .grpc import create_channel
+
+
+class TestCreateChannel(unittest.TestCase):
+    """Tests for `create_channel`."""
+
+    def test_insecure_channel_without_compression(self) -> None:
+        """Test that no compression is configured by default."""
+        # Execute
+        with patch("grpc.insecure_channel", return_value=Mock()) as mock_channel:
+            create_channel(server_address="localhost:9092", insecure=True)
+
+        # Assert
+        _, kwargs = mock_channel.call_args
+        self.assertIsNone(kwargs["compression"])
+
+    def test_insecure_channel_with_compression(self) -> None:
+        """Test that compression is passed to an insecure channel."""
+        # Execute
+        with patch("grpc.insecure_channel", return_value=Mock()) as mock_channel:
+            create_channel(
+                server_address="localhost:9092",
+                insecure=True,
+                compression=grpc.Compression.Gzip,
+            )
+
+        # Assert
+        _, kwargs = mock_channel.call_args
+        self.assertEqual(kwargs["compression"], grpc.Compression.Gzip)
+
+    def test_secure_channel_with_compression(self) -> None:
+        """Test that compression is passed to a secure channel."""
+        # Execute
+        with patch("grpc.secure_channel", return_value=Mock()) as mock_channel:
+            create_channel(
+                server_address="localhost:9092",
+                insecure=False,
+                compression=grpc.Compression.Gzip,
+            )
+
+        # Assert
+        _, kwargs = mock_channel.call_args
+        self.assertEqual(kwargs["compression"], grpc.Compression.Gzip)
+
+    def test_service_config(self) -> None:
+        """Test that a service config enables retries on the channel."""
+        # Prepare
+        service_config = {"methodConfig": [{"name": [{"service": "a.B"}]}]}
+
+        # Execute
+        with patch("grpc.insecure_channel", return_value=Mock()) as mock_channel:
+            create_channel(
+                server_address="localhost:9092",
+                insecure=True,
+                service_config=service_config,
+            )
+
+        # Assert
+        _, kwargs = mock_channel.call_args
+        options = dict(kwargs["options"])
+        self.assertEqual(options["grpc.enable_retries"], 1)
+        self.assertEqual(json.loads(options["grpc.service_config"]), service_config)
+
+    def test_conflicting_parameters(self) -> None:
+        """Test that root certificates cannot be combined with `insecure`."""
+        with self.assertRaises(ValueError):
+            create_channel(
+                server_address="localhost:9092",
+                insecure=True,
+                root_certificates=b"certificates",
+            )
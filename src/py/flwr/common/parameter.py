@@ -47,8 +47,32 @@ def ndarray_to_bytes(ndarray: NDArray) -> bytes:
 def bytes_to_ndarray(tensor: bytes) -> NDArray:
     """Deserialize NumPy ndarray from bytes."""
     bytes_io = BytesIO(tensor)
-    # WARNING: NEVER set allow_pickle to true.
-    # Reason: loading pickled data can execute arbitrary code
-    # Source: https://numpy.org/doc/stable/reference/generated/numpy.load.html
-    ndarray_deserialized = np.load(bytes_io, allow_pickle=False)
-    return cast(NDArray, ndarray_deserialized)
+    npy_format = np.lib.format
+    version = npy_format.read_magic(bytes_io)  # type: ignore
+    if version == (1, 0):
+        header = npy_format.read_array_header_1_0(bytes_io)  # type: ignore
+    elif version == (2, 0):
+        header = npy_format.read_array_header_2_0(bytes_io)  # type: ignore
+    else:
+        header = ((), False, np.dtype(object))
+    shape, fortran_order, dtype = header
+
+    if dtype.hasobject or not dtype.itemsize:
+        # Fall back to `np.load` for anything that is not a plain buffer of values
+        bytes_io.seek(0)
+        # WARNING: NEVER set allow_pickle to true.
+        # Reason: loading pickled data can execute arbitrary code
+        # Source: https://numpy.org/doc/stable/reference/generated/numpy.load.html
+        ndarray_deserialized = np.load(bytes_io, allow_pickle=False)
+        return cast(NDArray, ndarray_deserialized)
+
+    # Read the values directly from the buffer instead of streaming them through
+    # `np.load`, then copy once so that the returned array is writable
+    ndarray_view = np.frombuffer(
+        tensor, dtype=dtype, count=int(np.prod(shape)), offset=bytes_io.tell()
+    )
+    if fortran_order:
+        ndarray_view = ndarray_view.reshape(shape[::-1]).transpose()
+    else:
+        ndarray_view = ndarray_view.reshape(shape)
+    return cast(NDArray, ndarray_view.copy(order="K"))
@@ -17,6 +17,7 @@
 tests.
 """
 
+from io import BytesIO
 
 import numpy as np
 import pytest
@@ -37,3 +38,39 @@ def test_serialisation_deserialisation() -> None:
     # Test false positive
     with pytest.raises(AssertionError, match="Arrays are not equal"):
         np.testing.assert_equal(arr_deserialized, np.ones((3, 2)))
+
+
+@pytest.mark.parametrize(
+    "arr",
+    [
+        np.arange(12, dtype=np.float32).reshape(3, 4),
+        np.asfortranarray(np.arange(12, dtype=np.int64).reshape(3, 4)),
+        np.array(3.5),
+        np.zeros((0, 5), dtype=np.float16),
+        np.array([True, False, True]),
+        np.array([(1, 2.0)], dtype=[("a", "<i4"), ("b", "<f8")]),
+    ],
+)
+def test_deserialisation_is_writable_copy(arr: np.ndarray) -> None:  # type: ignore
+    """Test that deserialized arrays match the original and own their memory."""
+    # Execute
+    arr_deserialized = bytes_to_ndarray(ndarray_to_bytes(arr))
+
+    # Assert
+    np.testing.assert_equal(arr_deserialized, arr)
+    assert arr_deserialized.dtype == arr.dtype
+    assert arr_deserialized.shape == arr.shape
+    assert arr_deserialized.flags.writeable
+    assert arr_deserialized.flags.f_contiguous == arr.flags.f_contiguous
+
+
+def test_deserialisation_of_object_array_fails() -> None:
+    """Test that pickled object arrays are never loaded."""
+    # Prepare
+    arr = np.array([{"a": 1}], dtype=object)
+    np_bytes = BytesIO()
+    np.save(np_bytes, arr, allow_pickle=True)
+
+    # Execute & assert
+    with pytest.raises(ValueError):
+        bytes_to_ndarray(np_bytes.getvalue())
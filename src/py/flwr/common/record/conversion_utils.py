@@ -22,10 +22,32 @@ import numpy as np
 from ..constant import SType
 from ..typing import NDArray
 from .parametersrecord import Array
+from .quantization import QUANTIZED_STYPES, quantize
 
 
-def array_from_numpy(ndarray: NDArray) -> Array:
-    """Create Array from NumPy ndarray."""
+def array_from_numpy(ndarray: NDArray, stype: str = SType.NUMPY) -> Array:
+    """Create Array from NumPy ndarray.
+
+    Parameters
+    ----------
+    ndarray : NDArray
+        The NumPy array to serialize.
+    stype : str (default: SType.NUMPY)
+        The serialization type. `SType.NUMPY` stores the array losslessly.
+        `SType.NUMPY_BF16` and `SType.NUMPY_INT8` quantize floating-point arrays to
+        bfloat16 or int8, which reduces their size by 2x or 4x (for float32) at the
+        cost of precision. `Array.numpy()` restores the original dtype.
+    """
+    if stype in QUANTIZED_STYPES:
+        return Array(
+            dtype=str(ndarray.dtype),
+            shape=list(ndarray.shape),
+            stype=stype,
+            data=quantize(ndarray, stype),
+        )
+    if stype != SType.NUMPY:
+        raise ValueError(f"Unsupported serialization type: '{stype}'")
+
     buffer = BytesIO()
     # WARNING: NEVER set allow_pickle to true.
     # Reason: loading pickled data can execute arbitrary code
@@ -42,3 +42,8 @@ class TestArrayFromNumpy(unittest.TestCase):
         self.assertEqual(array_instance.shape, list(original_array.shape))
         self.assertEqual(array_instance.stype, SType.NUMPY)
         np.testing.assert_array_equal(deserialized_array, original_array)
+
+    def test_array_from_numpy_invalid_stype(self) -> None:
+        """Test the array_from_numpy function with an unknown stype."""
+        with self.assertRaises(ValueError):
+            array_from_numpy(np.array([1.0]), stype="invalid_stype")
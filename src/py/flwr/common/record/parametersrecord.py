@@ -15,13 +15,12 @@
 """ParametersRecord and Array."""
 
 from dataclasses import dataclass
-from io import BytesIO
-from typing import List, Optional, OrderedDict, cast
-
-import numpy as np
+from typing import List, Optional, OrderedDict
 
 from ..constant import SType
+from ..parameter import bytes_to_ndarray
 from ..typing import NDArray
+from .quantization import QUANTIZED_STYPES, dequantize
 from .typeddict import TypedDict
 
 
@@ -57,16 +56,13 @@ class Array:
 
     def numpy(self) -> NDArray:
         """Return the array as a NumPy array."""
+        if self.stype in QUANTIZED_STYPES:
+            return dequantize(self.data, self.stype, self.dtype, self.shape)
         if self.stype != SType.NUMPY:
             raise TypeError(
                 f"Unsupported serialization type for numpy conversion: '{self.stype}'"
             )
-        bytes_io = BytesIO(self.data)
-        # WARNING: NEVER set allow_pickle to true.
-        # Reason: loading pickled data can execute arbitrary code
-        # Source: https://numpy.org/doc/stable/reference/generated/numpy.load.html
-        ndarray_deserialized = np.load(bytes_io, allow_pickle=False)
-        return cast(NDArray, ndarray_deserialized)
+        return bytes_to_ndarray(self.data)
 
 
 def _check_key(key: str) -> None:
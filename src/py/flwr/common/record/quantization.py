@@ -0,0 +1,77 @@
+# Copyright 2024 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Lossy encodings of floating-point NumPy arrays for `Array`."""
+
+
+from typing import List
+
+import numpy as np
+
+from ..constant import SType
+from ..typing import NDArray
+
+QUANTIZED_STYPES = (SType.NUMPY_BF16, SType.NUMPY_INT8)
+
+_BF16_NAN = 0x7FC0
+_INT8_MAX = 127
+_SCALE_DTYPE = np.dtype("<f4")
+
+
+def quantize(ndarray: NDArray, stype: str) -> bytes:
+    """Encode a floating-point NumPy array using a quantized `SType`.
+
+    `SType.NUMPY_BF16` keeps the upper 16 bits of each float32 value (rounded to
+    nearest even). `SType.NUMPY_INT8` uses symmetric per-array int8 quantization, the
+    float32 scale is stored in the first four bytes.
+    """
+    if stype not in QUANTIZED_STYPES:
+        raise ValueError(f"Unsupported quantized serialization type: '{stype}'")
+    if not np.issubdtype(ndarray.dtype, np.floating):
+        raise TypeError(
+            f"Only floating-point arrays can be quantized, got '{ndarray.dtype}'"
+        )
+    values = np.ascontiguousarray(ndarray, dtype="<f4")
+
+    if stype == SType.NUMPY_BF16:
+        bits = values.view("<u4")
+        # Round to nearest even before dropping the lower 16 bits
+        rounded = (bits + (((bits >> 16) & 1) + 0x7FFF)) >> 16
+        bf16 = rounded.astype("<u2")
+        bf16[np.isnan(values)] = _BF16_NAN
+        bf16_data: bytes = bf16.tobytes()
+        return bf16_data
+
+    if not np.all(np.isfinite(values)):
+        raise ValueError("Arrays containing NaN or Inf cannot be quantized to int8")
+    max_abs = float(np.max(np.abs(values))) if values.size else 0.0
+    scale = max_abs / _INT8_MAX if max_abs > 0 else 1.0
+    int8 = np.round(values / scale).astype(np.int8)
+    int8_data: bytes = np.array(scale, dtype=_SCALE_DTYPE).tobytes() + int8.tobytes()
+    return int8_data
+
+
+def dequantize(data: bytes, stype: str, dtype: str, shape: List[int]) -> NDArray:
+    """Decode bytes produced by `quantize` into a NumPy array."""
+    if stype == SType.NUMPY_BF16:
+        bits = np.frombuffer(data, dtype="<u2").astype("<u4") << 16
+        values = bits.view("<f4")
+    elif stype == SType.NUMPY_INT8:
+        scale = np.frombuffer(data, dtype=_SCALE_DTYPE, count=1)[0]
+        int8 = np.frombuffer(data, dtype=np.int8, offset=_SCALE_DTYPE.itemsize)
+        values = int8.astype("<f4") * scale
+    else:
+        raise ValueError(f"Unsupported quantized serialization type: '{stype}'")
+    ndarray: NDArray = values.reshape(shape).astype(dtype, copy=False)
+    return ndarray
@@ -0,0 +1,108 @@
+# Copyright 2024 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Unit tests for Array quantization."""
+
+
+from typing import List
+
+import numpy as np
+import pytest
+
+from ..constant import SType
+from .conversion_utils import array_from_numpy
+from .quantization import dequantize, quantize
+
+
+@pytest.mark.parametrize(
+    "stype, expected_nbytes, atol",
+    [
+        (SType.NUMPY_BF16, 2 * 60, 1e-2),
+        (SType.NUMPY_INT8, 4 + 60, 1e-2),
+    ],
+)
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_quantize_dequantize(
+    stype: str, expected_nbytes: int, atol: float, dtype: str
+) -> None:
+    """Test that quantized arrays are smaller and close to the original."""
+    # Prepare
+    shape: List[int] = [3, 4, 5]
+    original = np.random.uniform(-1.0, 1.0, size=shape).astype(dtype)
+
+    # Execute
+    data = quantize(original, stype)
+    restored = dequantize(data, stype, dtype, shape)
+
+    # Assert
+    assert len(data) == expected_nbytes
+    assert restored.dtype == original.dtype
+    assert restored.shape == original.shape
+    np.testing.assert_allclose(restored, original, atol=atol)
+
+
+def test_bf16_special_values() -> None:
+    """Test that bfloat16 preserves zeros, infinities, and NaN."""
+    # Prepare
+    original = np.array([0.0, -0.0, np.inf, -np.inf, np.nan, 1.0], dtype=np.float32)
+
+    # Execute
+    restored = dequantize(
+        quantize(original, SType.NUMPY_BF16), SType.NUMPY_BF16, "float32", [6]
+    )
+
+    # Assert
+    np.testing.assert_array_equal(restored, original)
+
+
+def test_int8_all_zeros() -> None:
+    """Test int8 quantization of an all-zero array."""
+    # Prepare
+    original = np.zeros((2, 2), dtype=np.float32)
+
+    # Execute
+    restored = dequantize(
+        quantize(original, SType.NUMPY_INT8), SType.NUMPY_INT8, "float32", [2, 2]
+    )
+
+    # Assert
+    np.testing.assert_array_equal(restored, original)
+
+
+def test_int8_rejects_non_finite() -> None:
+    """Test that int8 quantization fails for arrays with NaN."""
+    with pytest.raises(ValueError):
+        quantize(np.array([1.0, np.nan]), SType.NUMPY_INT8)
+
+
+def test_quantize_rejects_integer_arrays() -> None:
+    """Test that only floating-point arrays can be quantized."""
+    with pytest.raises(TypeError):
+        quantize(np.array([1, 2, 3]), SType.NUMPY_BF16)
+
+
+@pytest.mark.parametrize("stype", [SType.NUMPY_BF16, SType.NUMPY_INT8])
+def test_array_numpy_dequantizes(stype: str) -> None:
+    """Test that `Array.numpy()` restores quantized arrays."""
+    # Prepare
+    original = np.linspace(-2.0, 2.0, 12, dtype=np.float32).reshape(3, 4)
+
+    # Execute
+    array = array_from_numpy(original, stype=stype)
+
+    # Assert
+    assert array.stype == stype
+    assert array.dtype == "float32"
+    assert array.shape == [3, 4]
+    np.testing.assert_allclose(array.numpy(), original, atol=2e-2)
@@ -38,15 +38,9 @@ class RecordSetData:
         metrics_records: Optional[Dict[str, MetricsRecord]] = None,
         configs_records: Optional[Dict[str, ConfigsRecord]] = None,
     ) -> None:
-        self.parameters_records = TypedDict[str, ParametersRecord](
-            self._check_fn_str, self._check_fn_params
-        )
-        self.metrics_records = TypedDict[str, MetricsRecord](
-            self._check_fn_str, self._check_fn_metrics
-        )
-        self.configs_records = TypedDict[str, ConfigsRecord](
-            self._check_fn_str, self._check_fn_configs
-        )
+        self.parameters_records = TypedDict(self._check_fn_str, self._check_fn_params)
+        self.metrics_records = TypedDict(self._check_fn_str, self._check_fn_metrics)
+        self.configs_records = TypedDict(self._check_fn_str, self._check_fn_configs)
         if parameters_records is not None:
             self.parameters_records.update(parameters_records)
         if metrics_records is not None:
@@ -18,6 +18,9 @@
 from typing import Dict, Mapping, OrderedDict, Tuple, Union, cast, get_args
 
 from . import Array, ConfigsRecord, MetricsRecord, ParametersRecord, RecordSet
+from .constant import SType
+from .parameter import ndarray_to_bytes
+from .record.quantization import QUANTIZED_STYPES
 from .typing import (
     Code,
     ConfigsRecordValues,
@@ -50,6 +53,9 @@ def parametersrecord_to_parameters(
     might not be possible to reconstruct such data structures from `Parameters` objects
     alone. Additional information or metadata must be provided from elsewhere.
 
+    Quantized `Arrays` (e.g. `SType.NUMPY_BF16`) are dequantized and stored as
+    regular serialized NumPy arrays, since legacy `Parameters` cannot describe them.
+
     Parameters
     ----------
     record : ParametersRecord
@@ -61,13 +67,19 @@ def parametersrecord_to_parameters(
     parameters = Parameters(tensors=[], tensor_type="")
 
     for key in list(record.keys()):
+        array = record[key]
+        stype = array.stype
         if key != EMPTY_TENSOR_KEY:
-            parameters.tensors.append(record[key].data)
+            if stype in QUANTIZED_STYPES:
+                parameters.tensors.append(ndarray_to_bytes(array.numpy()))
+                stype = SType.NUMPY
+            else:
+                parameters.tensors.append(array.data)
 
         if not parameters.tensor_type:
             # Setting from first array in record. Recall the warning in the docstrings
             # of this function.
-            parameters.tensor_type = record[key].stype
+            parameters.tensor_type = stype
 
         if not keep_input:
             del record[key]
@@ -15,12 +15,14 @@
 """RecordSet from legacy messages tests."""
 
 from copy import deepcopy
-from typing import Callable, Dict
+from typing import Callable, Dict, OrderedDict
 
 import numpy as np
 import pytest
 
-from .parameter import ndarrays_to_parameters
+from . import ParametersRecord, array_from_numpy
+from .constant import SType
+from .parameter import ndarrays_to_parameters, parameters_to_ndarrays
 from .recordset_compat import (
     evaluateins_to_recordset,
     evaluateres_to_recordset,
@@ -30,6 +32,7 @@ from .recordset_compat import (
     getparametersres_to_recordset,
     getpropertiesins_to_recordset,
     getpropertiesres_to_recordset,
+    parametersrecord_to_parameters,
     recordset_to_evaluateins,
     recordset_to_evaluateres,
     recordset_to_fitins,
@@ -63,6 +66,28 @@ def get_ndarrays() -> NDArrays:
     return [arr1, arr2]
 
 
+@pytest.mark.parametrize("stype", [SType.NUMPY_BF16, SType.NUMPY_INT8])
+def test_quantized_parametersrecord_to_parameters(stype: str) -> None:
+    """Test that quantized Arrays become regular NumPy tensors in Parameters."""
+    # Prepare
+    ndarrays = get_ndarrays()
+    record = ParametersRecord(
+        OrderedDict(
+            (str(i), array_from_numpy(arr, stype=stype))
+            for i, arr in enumerate(ndarrays)
+        )
+    )
+
+    # Execute
+    parameters = parametersrecord_to_parameters(record, keep_input=True)
+
+    # Assert
+    assert parameters.tensor_type == SType.NUMPY
+    for restored, original in zip(parameters_to_ndarrays(parameters), ndarrays):
+        assert restored.dtype == original.dtype
+        np.testing.assert_allclose(restored, original, atol=5e-2)
+
+
 ##################################################
 #  Testing conversion: *Ins --> RecordSet --> *Ins
 #  Testing conversion: *Res <-- RecordSet <-- *Res
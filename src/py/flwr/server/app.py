@@ -33,7 +33,7 @@ from cryptography.hazmat.primitives.serialization import (
 )
 
 from flwr.common import GRPC_MAX_MESSAGE_LENGTH, EventType, event
-from flwr.common.address import parse_address
+from flwr.common.address import is_unix_socket_address, parse_address
 from flwr.common.constant import (
     MISSING_EXTRA_REST,
     TRANSPORT_TYPE_GRPC_ADAPTER,
@@ -245,6 +245,8 @@ def run_superlink() -> None:
 
     # Start Fleet API
     if args.fleet_api_type == TRANSPORT_TYPE_REST:
+        if is_unix_socket_address(fleet_address):
+            sys.exit("The REST Fleet API does not support Unix domain sockets.")
         if (
             importlib.util.find_spec("requests")
             and importlib.util.find_spec("starlette")
@@ -325,6 +327,9 @@ def run_superlink() -> None:
 
 
 def _format_address(address: str) -> Tuple[str, str, int]:
+    # gRPC servers bind to Unix domain sockets directly, there is no host or port
+    if is_unix_socket_address(address):
+        return (address, "", 0)
     parsed_address = parse_address(address)
     if not parsed_address:
         sys.exit(
@@ -631,7 +636,8 @@ def _add_args_common(parser: argparse.ArgumentParser) -> None:
 def _add_args_driver_api(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--driver-api-address",
-        help="Driver API (gRPC) server address (IPv4, IPv6, or a domain name).",
+        help="Driver API (gRPC) server address (IPv4, IPv6, a domain name, or a "
+        "Unix domain socket such as `unix:/tmp/flwr-driver.sock`).",
         default=ADDRESS_DRIVER_API,
     )
 
@@ -651,7 +657,8 @@ def _add_args_fleet_api(parser: argparse.ArgumentParser) -> None:
     )
     parser.add_argument(
         "--fleet-api-address",
-        help="Fleet API server address (IPv4, IPv6, or a domain name).",
+        help="Fleet API server address (IPv4, IPv6, a domain name, or, for gRPC, a "
+        "Unix domain socket such as `unix:/tmp/flwr-fleet.sock`).",
     )
     parser.add_argument(
         "--fleet-api-num-workers",
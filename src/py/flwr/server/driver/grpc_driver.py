@@ -47,6 +47,23 @@ from .driver import Driver
 
 DEFAULT_SERVER_ADDRESS_DRIVER = "[::]:9091"
 
+# Let gRPC retry Driver API calls that fail with UNAVAILABLE (e.g., while the
+# SuperLink is briefly unreachable). gRPC caps `maxAttempts` at 5.
+DRIVER_SERVICE_CONFIG = {
+    "methodConfig": [
+        {
+            "name": [{"service": "flwr.proto.Driver"}],
+            "retryPolicy": {
+                "maxAttempts": 5,
+                "initialBackoff": "1s",
+                "maxBackoff": "16s",
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": ["UNAVAILABLE"],
+            },
+        }
+    ]
+}
+
 ERROR_MESSAGE_DRIVER_NOT_CONNECTED = """
 [Driver] Error: Not connected.
 
@@ -102,6 +119,7 @@ class GrpcDriver(Driver):
             server_address=self._addr,
             insecure=(self._cert is None),
             root_certificates=self._cert,
+            service_config=DRIVER_SERVICE_CONFIG,
         )
         self._grpc_stub = DriverStub(self._channel)
         log(DEBUG, "[Driver] Connected to %s", self._addr)
@@ -266,8 +284,11 @@ class GrpcDriver(Driver):
             )
             if len(msg_ids) == 0:
                 break
-            # Sleep
-            time.sleep(3)
+            # Sleep, but do not overshoot the timeout
+            sleep_time = 3.0
+            if timeout is not None:
+                sleep_time = max(min(sleep_time, end_time - time.time()), 0.0)
+            time.sleep(sleep_time)
         return ret
 
     def close(self) -> None:
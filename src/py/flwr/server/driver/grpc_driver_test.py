@@ -24,13 +24,17 @@ from flwr.common.message import Error
 from flwr.common.serde import error_to_proto, recordset_to_proto
 from flwr.proto.driver_pb2 import (  # pylint: disable=E0611
     GetNodesRequest,
+    GetNodesResponse,
     PullTaskResRequest,
+    PullTaskResResponse,
     PushTaskInsRequest,
+    PushTaskInsResponse,
 )
-from flwr.proto.run_pb2 import Run  # pylint: disable=E0611
+from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
+from flwr.proto.run_pb2 import GetRunResponse, Run  # pylint: disable=E0611
 from flwr.proto.task_pb2 import Task, TaskRes  # pylint: disable=E0611
 
-from .grpc_driver import GrpcDriver
+from .grpc_driver import DRIVER_SERVICE_CONFIG, GrpcDriver
 
 
 class TestGrpcDriver(unittest.TestCase):
@@ -38,13 +42,12 @@ class TestGrpcDriver(unittest.TestCase):
 
     def setUp(self) -> None:
         """Initialize mock GrpcDriverStub and Driver instance before each test."""
-        mock_response = Mock(
+        mock_response = GetRunResponse(
             run=Run(run_id=61016, fab_id="mock/mock", fab_version="v1.0.0")
         )
         self.mock_stub = Mock()
         self.mock_channel = Mock()
         self.mock_stub.GetRun.return_value = mock_response
-        mock_response.HasField.return_value = True
         self.driver = GrpcDriver(run_id=61016)
         self.driver._grpc_stub = self.mock_stub  # pylint: disable=protected-access
         self.driver._channel = self.mock_channel  # pylint: disable=protected-access
@@ -57,11 +60,25 @@ class TestGrpcDriver(unittest.TestCase):
         self.assertEqual(self.driver.run.fab_version, "v1.0.0")
         self.mock_stub.GetRun.assert_called_once()
 
+    def test_connect_with_retry_policy(self) -> None:
+        """Test that the Driver API channel is created with a retry policy."""
+        # Prepare
+        driver = GrpcDriver(run_id=61016)
+
+        # Execute
+        with patch(
+            "flwr.server.driver.grpc_driver.create_channel", return_value=Mock()
+        ) as mock_create_channel:
+            driver._connect()  # pylint: disable=protected-access
+
+        # Assert
+        _, kwargs = mock_create_channel.call_args
+        self.assertEqual(kwargs["service_config"], DRIVER_SERVICE_CONFIG)
+
     def test_get_nodes(self) -> None:
         """Test retrieval of nodes."""
         # Prepare
-        mock_response = Mock()
-        mock_response.nodes = [Mock(node_id=404), Mock(node_id=200)]
+        mock_response = GetNodesResponse(nodes=[Node(node_id=404), Node(node_id=200)])
         self.mock_stub.GetNodes.return_value = mock_response
 
         # Execute
@@ -79,7 +96,7 @@ class TestGrpcDriver(unittest.TestCase):
     def test_push_messages_valid(self) -> None:
         """Test pushing valid messages."""
         # Prepare
-        mock_response = Mock(task_ids=["id1", "id2"])
+        mock_response = PushTaskInsResponse(task_ids=["id1", "id2"])
         self.mock_stub.PushTaskIns.return_value = mock_response
         msgs = [
             self.driver.create_message(RecordSet(), "", 0, "", DEFAULT_TTL)
@@ -95,14 +112,14 @@ class TestGrpcDriver(unittest.TestCase):
         self.assertEqual(len(args), 1)
         self.assertEqual(len(kwargs), 0)
         self.assertIsInstance(args[0], PushTaskInsRequest)
-        self.assertEqual(msg_ids, mock_response.task_ids)
+        self.assertEqual(msg_ids, list(mock_response.task_ids))
         for task_ins in args[0].task_ins_list:
             self.assertEqual(task_ins.run_id, 61016)
 
     def test_push_messages_invalid(self) -> None:
         """Test pushing invalid messages."""
         # Prepare
-        mock_response = Mock(task_ids=["id1", "id2"])
+        mock_response = PushTaskInsResponse(task_ids=["id1", "id2"])
         self.mock_stub.PushTaskIns.return_value = mock_response
         msgs = [
             self.driver.create_message(RecordSet(), "", 0, "", DEFAULT_TTL)
@@ -118,15 +135,20 @@ class TestGrpcDriver(unittest.TestCase):
     def test_pull_messages_with_given_message_ids(self) -> None:
         """Test pulling messages with specific message IDs."""
         # Prepare
-        mock_response = Mock()
         # A Message must have either content or error set so we prepare
         # two tasks that contain these.
-        mock_response.task_res_list = [
-            TaskRes(
-                task=Task(ancestry=["id2"], recordset=recordset_to_proto(RecordSet()))
-            ),
-            TaskRes(task=Task(ancestry=["id3"], error=error_to_proto(Error(code=0)))),
-        ]
+        mock_response = PullTaskResResponse(
+            task_res_list=[
+                TaskRes(
+                    task=Task(
+                        ancestry=["id2"], recordset=recordset_to_proto(RecordSet())
+                    )
+                ),
+                TaskRes(
+                    task=Task(ancestry=["id3"], error=error_to_proto(Error(code=0)))
+                ),
+            ]
+        )
         self.mock_stub.PullTaskRes.return_value = mock_response
         msg_ids = ["id1", "id2", "id3"]
 
@@ -146,12 +168,11 @@ class TestGrpcDriver(unittest.TestCase):
     def test_send_and_receive_messages_complete(self) -> None:
         """Test send and receive all messages successfully."""
         # Prepare
-        mock_response = Mock(task_ids=["id1"])
-        self.mock_stub.PushTaskIns.return_value = mock_response
+        self.mock_stub.PushTaskIns.return_value = PushTaskInsResponse(task_ids=["id1"])
         # The response message must include either `content` (i.e. a recordset) or
         # an `Error`. We choose the latter in this case
         error_proto = error_to_proto(Error(code=0))
-        mock_response = Mock(
+        mock_response = PullTaskResResponse(
             task_res_list=[TaskRes(task=Task(ancestry=["id1"], error=error_proto))]
         )
         self.mock_stub.PullTaskRes.return_value = mock_response
@@ -168,9 +189,8 @@ class TestGrpcDriver(unittest.TestCase):
         """Test send and receive messages but time out."""
         # Prepare
         sleep_fn = time.sleep
-        mock_response = Mock(task_ids=["id1"])
-        self.mock_stub.PushTaskIns.return_value = mock_response
-        mock_response = Mock(task_res_list=[])
+        self.mock_stub.PushTaskIns.return_value = PushTaskInsResponse(task_ids=["id1"])
+        mock_response = PullTaskResResponse(task_res_list=[])
         self.mock_stub.PullTaskRes.return_value = mock_response
         msgs = [self.driver.create_message(RecordSet(), "", 0, "", DEFAULT_TTL)]
 
@@ -183,6 +203,26 @@ class TestGrpcDriver(unittest.TestCase):
         self.assertLess(time.time() - start_time, 0.2)
         self.assertEqual(len(ret_msgs), 0)
 
+    def test_send_and_receive_messages_sleep_bounded_by_timeout(self) -> None:
+        """Test that waiting for replies does not overshoot the timeout."""
+        # Prepare
+        sleep_fn = time.sleep
+        self.mock_stub.PushTaskIns.return_value = PushTaskInsResponse(task_ids=["id1"])
+        mock_response = PullTaskResResponse(task_res_list=[])
+        self.mock_stub.PullTaskRes.return_value = mock_response
+        msgs = [self.driver.create_message(RecordSet(), "", 0, "", DEFAULT_TTL)]
+
+        # Execute
+        with patch("time.sleep", side_effect=sleep_fn) as mock_sleep:
+            start_time = time.time()
+            ret_msgs = list(self.driver.send_and_receive(msgs, timeout=0.1))
+
+        # Assert
+        self.assertLess(time.time() - start_time, 1.0)
+        self.assertEqual(len(ret_msgs), 0)
+        for args, _ in mock_sleep.call_args_list:
+            self.assertLessEqual(args[0], 0.1)
+
     def test_del_with_initialized_driver(self) -> None:
         """Test cleanup behavior when Driver is initialized."""
         # Execute
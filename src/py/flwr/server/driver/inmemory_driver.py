@@ -178,6 +178,9 @@ class InMemoryDriver(Driver):
             )
             if len(msg_ids) == 0:
                 break
-            # Sleep
-            time.sleep(3)
+            # Sleep, but do not overshoot the timeout
+            sleep_time = 3.0
+            if timeout is not None:
+                sleep_time = max(min(sleep_time, end_time - time.time()), 0.0)
+            time.sleep(sleep_time)
         return ret
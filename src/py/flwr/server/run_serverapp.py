@@ -251,7 +251,8 @@ def _parse_args_run_server_app() -> argparse.ArgumentParser:
     parser.add_argument(
         "--superlink",
         default=ADDRESS_DRIVER_API,
-        help="SuperLink Driver API (gRPC-rere) address (IPv4, IPv6, or a domain name)",
+        help="SuperLink Driver API (gRPC-rere) address (IPv4, IPv6, a domain name, "
+        "or a Unix domain socket such as `unix:/tmp/flwr-driver.sock`)",
     )
     parser.add_argument(
         "--run-id",
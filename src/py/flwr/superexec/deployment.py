@@ -145,7 +145,7 @@ class DeploymentEngine(Executor):
 
             # Call SuperLink to create run
             run_id: int = self._create_run(fab_id, fab_version, override_config)
-            log(INFO, "Created run %s", str(run_id))
+            log(INFO, "Created run %s", run_id)
 
             command = [
                 "flower-server-app",
@@ -170,7 +170,7 @@ class DeploymentEngine(Executor):
                 command,
                 text=True,
             )
-            log(INFO, "Started run %s", str(run_id))
+            log(INFO, "Started run %s", run_id)
 
             return RunTracker(
                 run_id=run_id,
@@ -178,7 +178,7 @@ class DeploymentEngine(Executor):
             )
         # pylint: disable-next=broad-except
         except Exception as e:
-            log(ERROR, "Could not start run: %s", str(e))
+            log(ERROR, "Could not start run: %s", e)
             return None
 
 
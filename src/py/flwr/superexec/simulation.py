@@ -154,7 +154,7 @@ class SimulationEngine(Executor):
 
             # In Simulation there is no SuperLink, still we create a run_id
             run_id = generate_rand_int_from_bytes(RUN_ID_NUM_BYTES)
-            log(INFO, "Created run %s", str(run_id))
+            log(INFO, "Created run %s", run_id)
 
             # Prepare commnand
             command = [
@@ -177,7 +177,7 @@ class SimulationEngine(Executor):
                 text=True,
             )
 
-            log(INFO, "Started run %s", str(run_id))
+            log(INFO, "Started run %s", run_id)
 
             return RunTracker(
                 run_id=run_id,
@@ -186,7 +186,7 @@ class SimulationEngine(Executor):
 
         # pylint: disable-next=broad-except
         except Exception as e:
-            log(ERROR, "Could not start run: %s", str(e))
+            log(ERROR, "Could not start run: %s", e)
             return None
 
 